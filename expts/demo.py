@@ -2,7 +2,7 @@
 """
 expts/demo.py
 
-End-to-end demo (verbose), OS-agnostic (Linux / macOS / Windows):
+End-to-end demo, OS-agnostic (Linux / macOS / Windows):
 
   - builds & starts ml-service, chain, api-gateway, prometheus
   - waits for health endpoints
@@ -17,20 +17,27 @@ Usage:
 
 Environment:
   KEEP_CONTAINERS=1  -> leave containers running after demo
+  SKIP_BUILD=1       -> reuse existing images instead of running compose build
+  DEMO_VERBOSE=1     -> pretty-print every request payload and JSON response
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import http.client
+import io
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Sequence
-from urllib.error import URLError, HTTPError
-from urllib.request import Request, urlopen
+from typing import Callable, Dict, Iterator, List, Sequence, TextIO, Tuple, TypeVar
+from urllib.parse import urlsplit
 
 
 # -----------------------------------------------------------------------------
@@ -54,6 +61,8 @@ def _colour_codes():
 
 C = _colour_codes()
 
+VERBOSE = os.environ.get("DEMO_VERBOSE", "0") == "1"
+
 
 def log_kv(label: str, *values: str) -> None:
     print(f"  {C['DIM']}{label}:{C['RESET']} {' '.join(str(v) for v in values)}")
@@ -80,6 +89,69 @@ def err(msg: str) -> None:
     print(f"{C['RED']}ERROR{C['RESET']}: {msg}", file=sys.stderr)
 
 
+# -----------------------------------------------------------------------------
+# Concurrency helpers
+# -----------------------------------------------------------------------------
+T = TypeVar("T")
+
+
+class _ThreadLocalStdout:
+    """
+    sys.stdout proxy that lets a thread divert its prints into a buffer.
+
+    Threads that have not called `capture()` write straight through.
+    """
+
+    def __init__(self, target: TextIO) -> None:
+        self.target = target
+        self._local = threading.local()
+
+    def write(self, s: str) -> int:
+        return getattr(self._local, "buffer", self.target).write(s)
+
+    def __getattr__(self, name: str):
+        return getattr(self.target, name)
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        buf = io.StringIO()
+        self._local.buffer = buf
+        try:
+            yield buf
+        finally:
+            del self._local.buffer
+
+
+def run_parallel(fn: Callable[[T], None], items: Sequence[T], max_workers: int = 8) -> None:
+    """
+    Run `fn` over `items` on a thread pool.
+
+    Each task's output is buffered and printed as one block, in input order,
+    so concurrent tasks don't interleave their logs. The first task that
+    raises has its output printed and its exception re-raised.
+    """
+    proxy = _ThreadLocalStdout(sys.stdout)
+
+    def task(item: T) -> Tuple[str, BaseException | None]:
+        with proxy.capture() as buf:
+            try:
+                fn(item)
+            except BaseException as e:
+                return buf.getvalue(), e
+        return buf.getvalue(), None
+
+    sys.stdout = proxy  # type: ignore[assignment]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for output, exc in pool.map(task, items):
+                proxy.target.write(output)
+                proxy.target.flush()
+                if exc is not None:
+                    raise exc
+    finally:
+        sys.stdout = proxy.target
+
+
 # -----------------------------------------------------------------------------
 # Subprocess helpers
 # -----------------------------------------------------------------------------
@@ -89,8 +161,13 @@ def run(
     cwd: Path | None = None,
     check: bool = True,
     capture_output: bool = False,
+    env: Dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess:
-    """Thin wrapper around subprocess.run with sane defaults."""
+    """
+    Thin wrapper around subprocess.run with sane defaults.
+
+    `env`, if given, is layered on top of the current environment.
+    """
     cmd_str = " ".join(cmd)
     if cwd:
         note(f"Running: {cmd_str}  (cwd={cwd})")
@@ -102,6 +179,7 @@ def run(
         check=check,
         text=True,
         capture_output=capture_output,
+        env={**os.environ, **env} if env else None,
     )
 
 
@@ -144,16 +222,80 @@ def find_compose_command() -> List[str]:
 # -----------------------------------------------------------------------------
 # HTTP helpers
 # -----------------------------------------------------------------------------
+# Keep-alive connections keyed by (thread id, host:port) so repeated calls to
+# the same service reuse one socket instead of reconnecting every time.
+# http.client connections are not thread-safe, hence the per-thread key.
+_HTTP_CONNECTIONS: Dict[Tuple[int, str], http.client.HTTPConnection] = {}
+_HTTP_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _close_http_connections() -> None:
+    with _HTTP_CONNECTIONS_LOCK:
+        for conn in _HTTP_CONNECTIONS.values():
+            conn.close()
+        _HTTP_CONNECTIONS.clear()
+
+
+atexit.register(_close_http_connections)
+
+
+def http_request(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None = None,
+    headers: Dict[str, str] | None = None,
+    timeout: float = 10.0,
+) -> Tuple[int, bytes]:
+    """
+    Send a request over a pooled keep-alive connection.
+
+    Returns (status, body). Transport errors are raised as OSError /
+    http.client.HTTPException; HTTP error statuses are returned as-is.
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    key = (threading.get_ident(), parts.netloc)
+
+    with _HTTP_CONNECTIONS_LOCK:
+        conn = _HTTP_CONNECTIONS.get(key)
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+            with _HTTP_CONNECTIONS_LOCK:
+                _HTTP_CONNECTIONS[key] = conn
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            with _HTTP_CONNECTIONS_LOCK:
+                _HTTP_CONNECTIONS.pop(key, None)
+            # The server may have dropped an idle keep-alive socket; retry
+            # once on a fresh connection before giving up.
+            if not reused:
+                raise
+            conn = None
+            reused = False
+
+
 def wait_for_http(url: str, max_tries: int = 30, delay: float = 2.0) -> None:
     print(f"Waiting for {url} ...")
     for i in range(1, max_tries + 1):
         try:
-            req = Request(url, method="GET")
-            with urlopen(req, timeout=5) as resp:
-                if 200 <= resp.status < 300:
-                    print(f"  {C['GREEN']}OK{C['RESET']} ({url})")
-                    return
-        except (URLError, HTTPError):
+            status, _ = http_request("GET", url, timeout=5)
+            if 200 <= status < 300:
+                print(f"  {C['GREEN']}OK{C['RESET']} ({url})")
+                return
+        except (OSError, http.client.HTTPException):
             pass
         time.sleep(delay)
 
@@ -162,92 +304,128 @@ def wait_for_http(url: str, max_tries: int = 30, delay: float = 2.0) -> None:
 
 
 def http_post_json(url: str, payload: dict) -> None:
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(url, data=data, method="POST")
-    req.add_header("Content-Type", "application/json")
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
-    # Show the payload like the original script
-    print(f"{C['DIM']}payload:{C['RESET']}")
-    for line in json.dumps(payload, indent=2).splitlines():
-        print(f"    {line}")
+    if VERBOSE:
+        print(f"{C['DIM']}payload:{C['RESET']}")
+        for line in json.dumps(payload, indent=2).splitlines():
+            print(f"    {line}")
 
     try:
-        with urlopen(req, timeout=10) as resp:
-            body = resp.read()
-            print(f"  {C['GREEN']}HTTP {resp.status}{C['RESET']}")
-            if body:
-                try:
-                    parsed = json.loads(body.decode("utf-8"))
-                    print("  response:", json.dumps(parsed, indent=2))
-                except Exception:
-                    print("  raw response:", body.decode("utf-8", errors="replace"))
-    except HTTPError as e:
-        # Mirror curl || true behaviour: don't crash the whole demo
-        warn(f"POST {url} returned HTTP {e.code}")
-        try:
-            body = e.read()
-            if body:
-                print("  error body:", body.decode("utf-8", errors="replace"))
-        except Exception:
-            pass
-    except URLError as e:
+        status, body = http_request(
+            "POST",
+            url,
+            body=data,
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+    except (OSError, http.client.HTTPException) as e:
         warn(f"POST {url} failed: {e}")
+        return
+
+    if status >= 400:
+        # Mirror curl || true behaviour: don't crash the whole demo
+        warn(f"POST {url} returned HTTP {status}")
+        if body:
+            print("  error body:", body.decode("utf-8", errors="replace"))
+        return
+
+    print(f"  {C['GREEN']}HTTP {status}{C['RESET']}")
+    if body:
+        text = body.decode("utf-8", errors="replace")
+        if VERBOSE:
+            try:
+                text = json.dumps(json.loads(text), indent=2)
+            except ValueError:
+                pass
+        print("  response:", text)
 
 
 # -----------------------------------------------------------------------------
 # Chain / logs helpers
 # -----------------------------------------------------------------------------
-HEIGHT_RE = re.compile(r"proposed block height=(\d+)")
+# Most chain log lines are not block proposals, so check for the literal
+# prefix with a plain substring test before running the regex.
+HEIGHT_PREFIX = "proposed block height="
+HEIGHT_RE = re.compile(re.escape(HEIGHT_PREFIX) + r"(\d+)")
 
 
-def wait_for_blocks(target_blocks: int = 10, poll_delay: float = 2.0, timeout_secs: int = 240) -> None:
+def wait_for_blocks(target_blocks: int = 10, timeout_secs: int = 240) -> None:
     """
-    Watch 'docker logs chain' for block production and compute timing stats.
+    Follow 'docker logs chain' for block production and compute timing stats.
+
+    A single `docker logs -f` process is kept open and each line is parsed
+    exactly once as it arrives, instead of re-reading the log tail on every
+    poll. If the follower exits early (e.g. the chain container restarts),
+    it is reattached with `--since` so only unseen lines are fetched.
 
     Height is zero-based, so height 9 == 10 blocks.
     """
     target_height = target_blocks - 1
     start = time.time()
+    deadline = start + timeout_secs
     last_height = -1
 
     log_section(f"Waiting for {target_blocks} blocks and benchmarking")
     print(f"Watching chain logs for block production (target: {target_blocks} blocks)...")
 
-    while (time.time() - start) < timeout_secs:
+    # --tail=400 replays recent history once so blocks produced while we
+    # were registering models still count; -f then streams new lines.
+    log_window = ["--tail=400"]
+
+    while time.time() < deadline:
         try:
-            proc = subprocess.run(
-                ["docker", "logs", "chain", "--tail=400"],
+            proc = subprocess.Popen(
+                ["docker", "logs", "-f", *log_window, "chain"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                capture_output=True,
-                check=False,
+                bufsize=1,
             )
         except FileNotFoundError:
             err("docker not found while reading chain logs.")
             raise SystemExit(1)
 
-        max_height = -1
-        for line in proc.stdout.splitlines():
-            m = HEIGHT_RE.search(line)
-            if m:
-                h = int(m.group(1))
-                if h > max_height:
-                    max_height = h
-
-        if max_height > last_height:
-            elapsed = int(time.time() - start)
-            note(f"latest height={max_height} (elapsed {elapsed}s)")
-            last_height = max_height
-
-        if max_height >= target_height:
-            duration = time.time() - start
-            avg = duration / target_blocks if target_blocks > 0 else float("nan")
-            print(
-                f"Produced {target_blocks} blocks in {duration:.1f}s "
-                f"(~{avg:.2f}s per block)"
-            )
-            return
+        # Kill the follower if the target is not reached in time; this
+        # unblocks the line iterator below with EOF.
+        timer = threading.Timer(max(deadline - time.time(), 0.0), proc.terminate)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                if HEIGHT_PREFIX not in line:
+                    continue
+                m = HEIGHT_RE.search(line)
+                if not m:
+                    continue
 
-        time.sleep(poll_delay)
+                h = int(m.group(1))
+                if h <= last_height:
+                    continue
+
+                elapsed = int(time.time() - start)
+                note(f"latest height={h} (elapsed {elapsed}s)")
+                last_height = h
+
+                if last_height >= target_height:
+                    duration = time.time() - start
+                    avg = duration / target_blocks if target_blocks > 0 else float("nan")
+                    print(
+                        f"Produced {target_blocks} blocks in {duration:.1f}s "
+                        f"(~{avg:.2f}s per block)"
+                    )
+                    return
+        finally:
+            timer.cancel()
+            proc.terminate()
+            proc.wait()
+
+        # Resume from where this stream ended rather than rescanning. The
+        # timestamp is floored to the second, so a few lines may be seen
+        # twice; heights at or below last_height are ignored anyway.
+        log_window = ["--since", str(int(time.time()))]
+        if time.time() < deadline:
+            warn("chain log stream ended early; reattaching")
+            time.sleep(1.0)
 
     err(f"Did not see {target_blocks} blocks within {timeout_secs}s")
     raise SystemExit(1)
@@ -256,20 +434,27 @@ def wait_for_blocks(target_blocks: int = 10, poll_delay: float = 2.0, timeout_se
 # -----------------------------------------------------------------------------
 # Model helpers (run code inside ml-service container)
 # -----------------------------------------------------------------------------
-def create_model(aid_hex: str) -> None:
-    script = f"""
+def create_models(aid_hexes: Sequence[str]) -> None:
+    """
+    Create dummy artefacts for all `aid_hexes` in a single `docker exec`.
+
+    The aids are passed as argv so torch is imported once for the whole
+    batch rather than once per model.
+    """
+    script = """
 import os
+import sys
 from pathlib import Path
 import torch
 
 model_root = Path(os.environ.get("ML_SERVICE_MODEL_ROOT", "/app/ml_service/models"))
 model_root.mkdir(parents=True, exist_ok=True)
-aid_hex = "{aid_hex}"
-model_path = model_root / (aid_hex + ".pt")
-torch.save({{"demo": aid_hex}}, model_path)
-print("model created:", model_path)
+for aid_hex in sys.argv[1:]:
+    model_path = model_root / (aid_hex + ".pt")
+    torch.save({"demo": aid_hex}, model_path)
+    print("model created:", model_path)
 """
-    run(["docker", "exec", "ml-service", "python", "-c", script], check=True)
+    run(["docker", "exec", "ml-service", "python", "-c", script, *aid_hexes], check=True)
 
 
 def register_model(
@@ -313,18 +498,34 @@ def main() -> None:
 
     compose_cmd = find_compose_command()
     keep_containers = os.environ.get("KEEP_CONTAINERS", "0") == "1"
+    skip_build = os.environ.get("SKIP_BUILD", "0") == "1"
 
     # -------------------------------------------------------------------------
     # 1. Build and start the devnet stack
     # -------------------------------------------------------------------------
     log_section("Building and starting devnet stack (ml-service, chain, api-gateway, prometheus)")
+    # Build images up front, then start containers without rebuilding, so
+    # health probes start as soon as the containers exist instead of
+    # competing with image builds for CPU. COMPOSE_PARALLEL_LIMIT caps how
+    # many builds/starts compose runs at once on small hosts.
+    compose_env = {"COMPOSE_PARALLEL_LIMIT": os.environ.get("COMPOSE_PARALLEL_LIMIT", "2")}
+    log_kv("compose", str(compose_file))
+    if skip_build:
+        note("SKIP_BUILD=1 so existing images are reused.")
+    else:
+        note("Building images; this can take a minute on first run.")
+        run(
+            compose_cmd + ["-f", str(compose_file), "build"],
+            cwd=deploy_dir,
+            check=True,
+            env=compose_env,
+        )
     run(
-        compose_cmd + ["-f", str(compose_file), "up", "-d", "--build"],
+        compose_cmd + ["-f", str(compose_file), "up", "-d", "--no-build"],
         cwd=deploy_dir,
         check=True,
+        env=compose_env,
     )
-    log_kv("compose", str(compose_file))
-    note("Containers are building; this can take a minute on first run.")
 
     try:
         # ---------------------------------------------------------------------
@@ -354,13 +555,15 @@ def main() -> None:
         wm_logit_lows = [-1.0, -0.8, -1.2, -0.6, -1.4, -0.5, -1.1, -0.7, -1.3, -0.9]
         wm_logit_highs = [1.0, 1.2, 0.9, 1.3, 0.8, 1.4, 0.95, 1.25, 1.5, 1.1]
 
-        for i in range(10):
-            log_section(f"Preparing model {i+1}/10")
-            aid_hex = f"{i+1:064x}"
-            evidence_hex = f"{i+1000:064x}"
+        aid_hexes = [f"{i+1:064x}" for i in range(10)]
+        evidence_hexes = [f"{i+1000:064x}" for i in range(10)]
 
-            log_kv("aid_hex", aid_hex)
-            log_kv("evidence_hex", evidence_hex)
+        create_models(aid_hexes)
+
+        def register(i: int) -> None:
+            log_section(f"Registering model {i+1}/10")
+            log_kv("aid_hex", aid_hexes[i])
+            log_kv("evidence_hex", evidence_hexes[i])
             log_kv(
                 "wm_profile",
                 f"tau_input={wm_tau_inputs[i]}",
@@ -368,21 +571,25 @@ def main() -> None:
                 f"band=[{wm_logit_lows[i]}, {wm_logit_highs[i]}]",
             )
 
-            create_model(aid_hex)
             register_model(
                 owner_hex,
-                aid_hex,
-                evidence_hex,
+                aid_hexes[i],
+                evidence_hexes[i],
                 wm_tau_inputs[i],
                 wm_tau_feats[i],
                 wm_logit_lows[i],
                 wm_logit_highs[i],
             )
 
+        # Registrations are independent HTTP POSTs, so overlap them; one
+        # worker (and keep-alive connection) per model puts every request
+        # in flight at once.
+        run_parallel(register, range(len(aid_hexes)), max_workers=len(aid_hexes))
+
         # ---------------------------------------------------------------------
         # 4. Wait for a few blocks and report timings
         # ---------------------------------------------------------------------
-        wait_for_blocks(target_blocks=10, poll_delay=2.0, timeout_secs=240)
+        wait_for_blocks(target_blocks=10, timeout_secs=240)
 
         # ---------------------------------------------------------------------
         # 5. Show some logs from api-gateway and chain
@@ -8,10 +8,18 @@ use Pydantic settings / env vars / TOML config.
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
-# Root directory for stored models.
-# Each model is expected to live at `<MODEL_ROOT>/<aid>.pt` where `aid`
-# is the hex-encoded artefact identifier used on-chain.
-MODEL_ROOT: Path = Path(os.environ.get("ML_SERVICE_MODEL_ROOT", "models")).resolve()
+
+@functools.cache
+def model_root() -> Path:
+    """
+    Root directory for stored models.
+
+    Each model is expected to live at `<MODEL_ROOT>/<aid>.pt` where `aid`
+    is the hex-encoded artefact identifier used on-chain. Resolved on first
+    use (not at import) and cached thereafter.
+    """
+    return Path(os.environ.get("ML_SERVICE_MODEL_ROOT", "models")).resolve()
@@ -8,16 +8,19 @@ Endpoints:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .config import MODEL_ROOT
 from .registry.filesystem_store import FilesystemModelRegistry
 from .schemas import HealthResponse, VerifyRequest, VerifyResponse
 from .watermark.verify import verify_model
 
+# Keep the default JSONResponse: with a `response_model` set, FastAPI
+# (>=0.130) serialises straight to JSON bytes in pydantic-core, which is
+# faster than ORJSONResponse (that path runs jsonable_encoder first).
 app = FastAPI(
     title="ML Authenticity Verification Service",
     version="0.1.0",
@@ -33,7 +36,7 @@ app.add_middleware(
 )
 
 # Attach the model registry to app state for reuse.
-app.state.registry = FilesystemModelRegistry(MODEL_ROOT)
+app.state.registry = FilesystemModelRegistry()
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -43,13 +46,17 @@ async def health() -> HealthResponse:
 
 
 @app.post("/verify", response_model=VerifyResponse)
-async def verify(req: VerifyRequest) -> VerifyResponse:
+def verify(req: VerifyRequest) -> VerifyResponse:
     """
     Verify authenticity of a model artefact.
 
     This endpoint is called by the Rust `HttpMlVerifier` client in the
     `chain` crate. It expects the `VerifyRequest` / `VerifyResponse`
     shapes defined in `schemas.py`.
+
+    Declared as a plain `def` so FastAPI runs it in its threadpool: the
+    verifier does blocking file IO and hashing, which would otherwise
+    stall the event loop and serialise concurrent requests.
     """
     registry: FilesystemModelRegistry = app.state.registry
     model_path: Path = registry.resolve(req.aid)
@@ -80,6 +87,12 @@ def run() -> None:
         python -m src.main
 
     or via the `ml-service` console_script defined in pyproject.toml.
+
+    Set `ML_SERVICE_WORKERS` to run several worker processes so /verify
+    scales across cores (default: 1). The event loop and HTTP parser are
+    left on uvicorn's "auto" choice, which picks uvloop + httptools when
+    installed (they come with `uvicorn[standard]`) and falls back cleanly
+    where they are unavailable (e.g. uvloop on Windows).
     """
     import uvicorn
 
@@ -88,4 +101,5 @@ def run() -> None:
         host="0.0.0.0",
         port=8080,
         reload=False,
+        workers=int(os.environ.get("ML_SERVICE_WORKERS", "1")),
     )
@@ -12,19 +12,27 @@ request.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from ..config import MODEL_ROOT
+from ..config import model_root
+
+# Upper bound on cached aid -> path entries. `aid`s arrive from network
+# requests, so the cache is reset rather than allowed to grow unbounded.
+_MAX_CACHED_PATHS = 4096
 
 
 class FilesystemModelRegistry:
     """Resolves model artefact IDs to local filesystem paths."""
 
     def __init__(self, root: Optional[Path] = None) -> None:
-        self._root = root or MODEL_ROOT
+        # Defaults to `model_root()`, resolved lazily on first use.
+        self._root = root
+        self._paths: Dict[str, Path] = {}
 
     @property
     def root(self) -> Path:
+        if self._root is None:
+            self._root = model_root()
         return self._root
 
     def resolve(self, aid_hex: str) -> Path:
@@ -32,7 +40,18 @@ class FilesystemModelRegistry:
         Resolve a hex-encoded `aid` into a model path.
 
         No validation is done on the path beyond joining it to the root.
+        Results are cached per `aid_hex`, since the chain verifies the
+        same artefacts repeatedly.
         """
+        path = self._paths.get(aid_hex)
+        if path is not None:
+            return path
+
         # Normalise to lower-case, strip any 0x prefix just in case.
         safe_aid = aid_hex.lower().removeprefix("0x")
-        return self._root / f"{safe_aid}.pt"
+        path = self.root / f"{safe_aid}.pt"
+
+        if len(self._paths) >= _MAX_CACHED_PATHS:
+            self._paths.clear()
+        self._paths[aid_hex] = path
+        return path
@@ -4,8 +4,8 @@ Watermark verification logic.
 For now this is deliberately lightweight and "stubby" so the end-to-end
 system is runnable without a full watermark implementation:
 
-- It loads the model (if present) via `torch.load` to sanity-check the
-  artefact.
+- It sanity-checks that the artefact exists and looks like a file
+  written by `torch.save` (without deserialising it).
 - It computes synthetic statistics deterministically from
   (aid, evidence_hash) so they are stable across runs.
 - It compares those stats to the provided `WmProfile` to derive an `ok`
@@ -17,14 +17,14 @@ watermarking pipeline later.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import struct
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Tuple
 
-import torch
-
 from ..schemas import WmProfile
 
 
@@ -37,6 +37,34 @@ class WatermarkStats:
     latency_ms: int
 
 
+# Leading bytes of files written by `torch.save`: the default zip-based
+# format, or a raw pickle (legacy `_use_new_zipfile_serialization=False`)
+# using protocol 2 / 3.
+_TORCH_MAGICS = (b"PK\x03\x04", b"\x80\x02", b"\x80\x03")
+
+
+def _looks_like_torch(path: Path) -> bool:
+    """
+    Cheap check that `path` is an existing PyTorch artefact.
+
+    Only the first few bytes are read, so this is O(1) regardless of
+    model size, unlike a full `torch.load`.
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(4)
+    except OSError:
+        return False
+    return head.startswith(_TORCH_MAGICS)
+
+
+_U64_PAIR = struct.Struct(">QQ")
+_MASK_48 = (1 << 48) - 1
+_INV_40 = 1.0 / ((1 << 40) - 1)
+_INV_48 = 1.0 / _MASK_48
+
+
+@functools.lru_cache(maxsize=4096)
 def _pseudo_random_stats(
     aid_hex: str, evidence_hash_hex: str
 ) -> Tuple[float, float, float]:
@@ -45,21 +73,51 @@ def _pseudo_random_stats(
 
     This avoids introducing actual randomness while still giving you
     non-trivial values for demos / tests.
+
+    The result is a pure function of its arguments, so it is memoised:
+    the chain re-verifies the same artefacts repeatedly.
     """
     seed_bytes = (aid_hex + evidence_hash_hex).encode("utf-8")
     digest = hashlib.blake2b(seed_bytes, digest_size=16).digest()
 
-    # Split 16 bytes into three 5-byte-ish chunks and normalise:
-    def to_unit_interval(b: bytes) -> float:
-        return int.from_bytes(b, byteorder="big") / ((1 << (8 * len(b))) - 1)
+    # Split 16 bytes into 5 / 5 / 6-byte big-endian chunks and normalise.
+    # Unpacking once into two u64s and masking avoids slicing and
+    # `int.from_bytes` per chunk.
+    hi, lo = _U64_PAIR.unpack(digest)
+    chunk0 = hi >> 24  # bytes 0..5
+    chunk1 = ((hi & 0xFFFFFF) << 16) | (lo >> 48)  # bytes 5..10
+    chunk2 = lo & _MASK_48  # bytes 10..16
 
-    trigger_acc = 0.8 + 0.2 * to_unit_interval(digest[0:5])  # 0.8 .. 1.0
-    feat_dist = 0.01 + 0.2 * to_unit_interval(digest[5:10])  # 0.01 .. 0.21
-    logit_stat = -0.05 + 0.1 * to_unit_interval(digest[10:16])  # -0.05 .. 0.05
+    trigger_acc = 0.8 + 0.2 * (chunk0 * _INV_40)  # 0.8 .. 1.0
+    feat_dist = 0.01 + 0.2 * (chunk1 * _INV_40)  # 0.01 .. 0.21
+    logit_stat = -0.05 + 0.1 * (chunk2 * _INV_48)  # -0.05 .. 0.05
 
     return trigger_acc, feat_dist, logit_stat
 
 
+# Extremes `_pseudo_random_stats` can produce (each is hit exactly).
+_TRIGGER_ACC_MAX = 1.0
+_FEAT_DIST_MIN = 0.01
+_LOGIT_STAT_MIN = -0.05
+_LOGIT_STAT_MAX = 0.05
+
+
+def _profile_is_satisfiable(wm_profile: WmProfile) -> bool:
+    """
+    Whether any stats in the synthetic ranges could pass `wm_profile`.
+
+    Lets `verify_model` reject impossible thresholds without touching the
+    artefact or hashing.
+    """
+    return (
+        wm_profile.tau_input <= _TRIGGER_ACC_MAX
+        and wm_profile.tau_feat >= _FEAT_DIST_MIN
+        and wm_profile.logit_band_low <= wm_profile.logit_band_high
+        and wm_profile.logit_band_high >= _LOGIT_STAT_MIN
+        and wm_profile.logit_band_low <= _LOGIT_STAT_MAX
+    )
+
+
 def verify_model(
     model_path: Path,
     aid_hex: str,
@@ -70,8 +128,9 @@ def verify_model(
     Perform a lightweight watermark verification.
 
     For now:
-    - if the model file cannot be loaded with `torch.load`, we treat it
-      as `ok=False` with zeroed stats;
+    - if `wm_profile` cannot be met by any stats in the synthetic ranges,
+      or the model file is missing or does not look like a PyTorch
+      artefact, we treat it as `ok=False` with zeroed stats;
     - otherwise we derive deterministic pseudo-random stats from
       (aid, evidence_hash) and compare them to the provided thresholds.
 
@@ -80,10 +139,7 @@ def verify_model(
     """
     start = time.perf_counter()
 
-    try:
-        # This will fail fast if the file is missing or not a PyTorch artifact.
-        _ = torch.load(model_path, map_location="cpu")
-    except Exception:
+    if not _profile_is_satisfiable(wm_profile) or not _looks_like_torch(model_path):
         end = time.perf_counter()
         latency_ms = int((end - start) * 1000)
         return WatermarkStats(
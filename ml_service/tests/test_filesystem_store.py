@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from src.registry.filesystem_store import FilesystemModelRegistry
+
+
+def test_resolve_normalises_aid(tmp_path: Path):
+    registry = FilesystemModelRegistry(root=tmp_path)
+
+    path = registry.resolve("0xABCD" + "ab" * 30)
+    assert path == tmp_path / ("abcd" + "ab" * 30 + ".pt")
+
+
+def test_resolve_is_stable_across_calls(tmp_path: Path):
+    registry = FilesystemModelRegistry(root=tmp_path)
+
+    aid_hex = "face" * 16
+    first = registry.resolve(aid_hex)
+    second = registry.resolve(aid_hex)
+
+    assert first == second == tmp_path / f"{aid_hex}.pt"
@@ -3,7 +3,7 @@ from pathlib import Path
 import torch
 
 from src.schemas import WmProfile
-from src.watermark.verify import verify_model
+from src.watermark.verify import _pseudo_random_stats, verify_model
 
 
 def test_verify_model_missing_file_returns_not_ok(tmp_path: Path):
@@ -29,6 +29,28 @@ def test_verify_model_missing_file_returns_not_ok(tmp_path: Path):
     assert stats.latency_ms >= 0
 
 
+def test_verify_model_non_torch_file_returns_not_ok(tmp_path: Path):
+    # File exists but is not something `torch.save` would produce.
+    model_path = tmp_path / "model.pt"
+    model_path.write_text("not a model")
+
+    wm_profile = WmProfile(
+        tau_input=0.0,
+        tau_feat=1.0,
+        logit_band_low=-1.0,
+        logit_band_high=1.0,
+    )
+
+    stats = verify_model(
+        model_path=model_path,
+        aid_hex="abcd" * 16,
+        evidence_hash_hex="1234" * 16,
+        wm_profile=wm_profile,
+    )
+
+    assert stats.ok is False
+
+
 def test_verify_model_with_valid_torch_file(tmp_path: Path):
     # Save a simple PyTorch object to disk.
     model_path = tmp_path / "model.pt"
@@ -55,3 +77,40 @@ def test_verify_model_with_valid_torch_file(tmp_path: Path):
     assert 0.01 <= stats.feat_dist <= 0.21
     assert -0.05 <= stats.logit_stat <= 0.05
     assert stats.latency_ms >= 0
+
+
+def test_verify_model_impossible_profile_short_circuits(tmp_path: Path):
+    model_path = tmp_path / "model.pt"
+    torch.save({"foo": "bar"}, model_path)
+
+    # trigger_acc never exceeds 1.0, so this profile can never pass.
+    wm_profile = WmProfile(
+        tau_input=1.5,
+        tau_feat=1.0,
+        logit_band_low=-1.0,
+        logit_band_high=1.0,
+    )
+
+    _pseudo_random_stats.cache_clear()
+    stats = verify_model(
+        model_path=model_path,
+        aid_hex="abcd" * 16,
+        evidence_hash_hex="1234" * 16,
+        wm_profile=wm_profile,
+    )
+
+    assert stats.ok is False
+    # Stats were never computed.
+    assert _pseudo_random_stats.cache_info().misses == 0
+
+
+def test_pseudo_random_stats_is_cached_and_deterministic():
+    _pseudo_random_stats.cache_clear()
+
+    first = _pseudo_random_stats("abcd" * 16, "1234" * 16)
+    second = _pseudo_random_stats("abcd" * 16, "1234" * 16)
+
+    assert first == second
+    info = _pseudo_random_stats.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1